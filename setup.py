@@ -23,6 +23,7 @@ setup(
     install_requires=[
         "click",
         "lammps",
+        "numpy",
         "pymatgen",
     ],
     entry_points={
@@ -1,24 +1,38 @@
-import random
 from typing import List
 
+import numpy as np
+
+_N_CANDIDATE = 64
+_RNG = np.random.default_rng()
+
 
 def create_niggli_cell(g_max: float) -> List[float]:
     """Create Niggli reduced cell
 
     Args:
-        g_max (float): The parameter, g_max.
+        g_max (float): The parameter, g_max. Must be non-negative.
+
+    Raises:
+        ValueError: If g_max is negative.
 
     Returns:
         List[float]: The sequence which represents Niggli reduced cell.
     """
+    if g_max < 0:
+        raise ValueError(f"g_max must be non-negative, got {g_max}")
+
+    n_candidate = _N_CANDIDATE
     while True:
-        niggli = [random.uniform(0, g_max) for _ in range(3)]
-        niggli.sort()
-        niggli.append(random.uniform(-0.5 * niggli[0], 0.5 * niggli[0]))
-        niggli.append(random.uniform(0, 0.5 * niggli[0]))
-        niggli.append(random.uniform(0, 0.5 * niggli[1]))
+        niggli = np.empty((n_candidate, 6))
+        niggli[:, :3] = np.sort(_RNG.uniform(0, g_max, size=(n_candidate, 3)), axis=1)
+        niggli[:, 3] = _RNG.uniform(-0.5 * niggli[:, 0], 0.5 * niggli[:, 0])
+        niggli[:, 4] = _RNG.uniform(0, 0.5 * niggli[:, 0])
+        niggli[:, 5] = _RNG.uniform(0, 0.5 * niggli[:, 1])
 
-        if (niggli[0] + niggli[1] + 2 * niggli[3]) >= (2 * niggli[4] + 2 * niggli[5]):
-            break
+        is_valid = (niggli[:, 0] + niggli[:, 1] + 2 * niggli[:, 3]) >= (
+            2 * niggli[:, 4] + 2 * niggli[:, 5]
+        )
+        if is_valid.any():
+            return niggli[np.argmax(is_valid)].tolist()
 
-    return niggli
+        n_candidate *= 2
@@ -0,0 +1,28 @@
+import pytest
+
+from struct_searcher.struct import create_niggli_cell
+
+
+@pytest.mark.parametrize("g_max", [0.5, 5.0, 100.0])
+def test_create_niggli_cell(g_max):
+    for _ in range(100):
+        niggli = create_niggli_cell(g_max)
+
+        assert len(niggli) == 6
+        assert all(isinstance(val, float) for val in niggli)
+        assert 0 <= niggli[0] <= niggli[1] <= niggli[2] <= g_max
+        assert abs(niggli[3]) <= 0.5 * niggli[0]
+        assert 0 <= niggli[4] <= 0.5 * niggli[0]
+        assert 0 <= niggli[5] <= 0.5 * niggli[1]
+        assert (niggli[0] + niggli[1] + 2 * niggli[3]) >= (
+            2 * niggli[4] + 2 * niggli[5]
+        )
+
+
+def test_create_niggli_cell_zero_g_max():
+    assert create_niggli_cell(0.0) == [0.0] * 6
+
+
+def test_create_niggli_cell_negative_g_max():
+    with pytest.raises(ValueError, match="g_max must be non-negative"):
+        create_niggli_cell(-1.0)